@@ -4,11 +4,42 @@ DCF Valuation Framework
 Professional-grade Discounted Cash Flow valuation tool for equity analysis.
 """
 
+import sys
+import threading
+import warnings
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Tuple, Optional
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Callable, List, Dict, Tuple, Optional
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # Numba is optional; kernels run as plain Python without it
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import numexpr
+    _HAS_NUMEXPR = True
+except ImportError:  # numexpr is optional; large arrays fall back to NumPy
+    _HAS_NUMEXPR = False
+
+# Numba's fallback workqueue threading layer aborts when parallel kernels are
+# launched from several threads at once, so launches are serialized
+_PARALLEL_KERNEL_LOCK = threading.Lock()
+
+# Element count above which numexpr's fused, threaded evaluation beats NumPy temporaries
+_NUMEXPR_MIN_SIZE = 10_000
 
 
 @dataclass
@@ -27,7 +58,14 @@ class CompanyData:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            'ticker': self.ticker,
+            'company_name': self.company_name,
+            'stock_price': self.stock_price,
+            'shares_outstanding': self.shares_outstanding,
+            'current_fcf': self.current_fcf,
+            'net_debt': self.net_debt
+        }
 
 
 @dataclass
@@ -39,8 +77,31 @@ class ValuationAssumptions:
     wacc: float  # Weighted Average Cost of Capital
     projection_years: int = 5
     
-    def validate(self) -> Tuple[bool, List[str]]:
-        """Validate assumptions for reasonableness"""
+    def validate(self, raise_on_error: bool = False) -> bool:
+        """
+        Check assumptions for reasonableness
+        
+        Args:
+            raise_on_error: Raise ValueError describing the issues instead of
+                returning False
+        
+        Returns:
+            True if all assumptions are within range
+        """
+        is_valid = not (
+            self.revenue_growth_rate < -0.5 or self.revenue_growth_rate > 1.0 or
+            self.terminal_growth_rate < 0 or self.terminal_growth_rate > 0.05 or
+            self.wacc <= self.terminal_growth_rate or
+            self.fcf_margin < 0 or self.fcf_margin > 1.0
+        )
+        
+        if not is_valid and raise_on_error:
+            raise ValueError("Invalid assumptions: " + "; ".join(self.format_errors()))
+        
+        return is_valid
+    
+    def format_errors(self) -> List[str]:
+        """Describe each assumption that fails validation"""
         errors = []
         
         if self.revenue_growth_rate < -0.5 or self.revenue_growth_rate > 1.0:
@@ -55,222 +116,658 @@ class ValuationAssumptions:
         if self.fcf_margin < 0 or self.fcf_margin > 1.0:
             errors.append("FCF margin should be between 0% and 100%")
         
-        return len(errors) == 0, errors
+        return errors
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            'revenue_growth_rate': self.revenue_growth_rate,
+            'fcf_margin': self.fcf_margin,
+            'terminal_growth_rate': self.terminal_growth_rate,
+            'wacc': self.wacc,
+            'projection_years': self.projection_years
+        }
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ValuationResult(Mapping):
+    """Outputs of a single DCF valuation, also readable as a read-only mapping"""
+    fcf_projections: np.ndarray  # contiguous float64, one entry per projection year
+    discount_factors: np.ndarray
+    pv_fcf: np.ndarray
+    terminal_value: float
+    pv_terminal_value: float
+    pv_fcf_sum: float
+    enterprise_value: float
+    equity_value: float
+    fair_value_per_share: float
+    current_price: float
+    upside_downside_pct: float
+    assessment: str
+    ev_to_fcf: Optional[float]
+    implied_pe: Optional[float]
+    fcf_contribution_pct: float
+    terminal_contribution_pct: float
+    
+    def __getitem__(self, key: str):
+        """Support dictionary-style access (results['enterprise_value'])"""
+        if key not in _RESULT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(_RESULT_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(_RESULT_FIELDS)
+    
+    def __eq__(self, other) -> bool:
+        """Mapping equality, comparing the projected series element-wise"""
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if len(other) != len(_RESULT_FIELDS) or any(key not in other for key in _RESULT_FIELDS):
+            return False
+        return all(
+            np.array_equal(self[key], other[key]) if key in _ARRAY_FIELDS
+            else self[key] == other[key]
+            for key in _RESULT_FIELDS
+        )
+    
+    # Compared by value like the dicts it replaces, so unhashable like them
+    __hash__ = None
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary"""
+        return {
+            'fcf_projections': self.fcf_projections,
+            'discount_factors': self.discount_factors,
+            'pv_fcf': self.pv_fcf,
+            'terminal_value': self.terminal_value,
+            'pv_terminal_value': self.pv_terminal_value,
+            'pv_fcf_sum': self.pv_fcf_sum,
+            'enterprise_value': self.enterprise_value,
+            'equity_value': self.equity_value,
+            'fair_value_per_share': self.fair_value_per_share,
+            'current_price': self.current_price,
+            'upside_downside_pct': self.upside_downside_pct,
+            'assessment': self.assessment,
+            'ev_to_fcf': self.ev_to_fcf,
+            'implied_pe': self.implied_pe,
+            'fcf_contribution_pct': self.fcf_contribution_pct,
+            'terminal_contribution_pct': self.terminal_contribution_pct
+        }
+
+
+# Field names backing ValuationResult's mapping interface, in declaration order
+_RESULT_FIELDS = tuple(field.name for field in fields(ValuationResult))
+
+# Fields holding per-year arrays, compared element-wise by ValuationResult.__eq__
+_ARRAY_FIELDS = ('fcf_projections', 'discount_factors', 'pv_fcf')
+
+
+@lru_cache(maxsize=32)
+def _years(projection_years: int) -> np.ndarray:
+    """Shared, read-only vector of projection years 1..N"""
+    years = np.arange(1, projection_years + 1, dtype=np.float64)
+    years.setflags(write=False)
+    return years
+
+
+@lru_cache(maxsize=256)
+def _discount_factors(wacc: float, projection_years: int) -> np.ndarray:
+    """Shared, read-only discount factors for a WACC and projection period"""
+    discount_factors = np.power(1.0 + wacc, -_years(projection_years))
+    discount_factors.setflags(write=False)
+    return discount_factors
+
+
+# error_model='numpy': a lane with wacc == terminal_growth yields inf like the
+# NumPy path instead of raising inside a parallel region, which Numba cannot
+# recover from. fastmath stays off because it assumes no inf/nan results.
+@njit(cache=True, error_model='numpy')
+def _dcf_kernel(current_fcf, growth, wacc, terminal_growth, projection_years,
+                net_debt, shares):
+    """Fair value per share from scalar inputs (no Python objects, so Numba stays in nopython mode)"""
+    pv_fcf_sum = 0.0
+    fcf = current_fcf
+    discount_factor = 1.0
+    for year in range(1, projection_years + 1):
+        fcf = current_fcf * (1.0 + growth) ** year
+        discount_factor = (1.0 + wacc) ** -year
+        pv_fcf_sum += fcf * discount_factor
+    terminal_value = fcf * (1.0 + terminal_growth) / (wacc - terminal_growth)
+    return (pv_fcf_sum + terminal_value * discount_factor - net_debt) / shares
+
+
+@njit(parallel=True, cache=True, error_model='numpy')
+def _dcf_sweep(current_fcfs, growths, waccs, terminal_growths, projection_years,
+               net_debt, shares):
+    """Apply _dcf_kernel across equal-length 1-D arrays of inputs in parallel"""
+    out = np.empty(growths.size)
+    for i in prange(growths.size):
+        out[i] = _dcf_kernel(current_fcfs[i], growths[i], waccs[i], terminal_growths[i],
+                             projection_years, net_debt, shares)
+    return out
+
+
+@njit(parallel=True, cache=True, error_model='numpy')
+def _dcf_grid(waccs, growths, current_fcf, terminal_growth, projection_years,
+              net_debt, shares):
+    """Fair values over a WACC x growth grid, parallelized across WACC rows"""
+    # Tabulate FCF per growth rate and discount factors per WACC once, so
+    # the per-cell work is multiply-adds instead of 2 * projection_years pows
+    fcf_table = np.empty((growths.size, projection_years))
+    for j in prange(growths.size):
+        for year in range(1, projection_years + 1):
+            fcf_table[j, year - 1] = current_fcf * (1.0 + growths[j]) ** year
+
+    discount_table = np.empty((waccs.size, projection_years))
+    for i in prange(waccs.size):
+        for year in range(1, projection_years + 1):
+            discount_table[i, year - 1] = (1.0 + waccs[i]) ** -year
+
+    last = projection_years - 1
+    out = np.empty((waccs.size, growths.size))
+    for i in prange(waccs.size):
+        for j in range(growths.size):
+            pv_fcf_sum = 0.0
+            for t in range(projection_years):
+                pv_fcf_sum += fcf_table[j, t] * discount_table[i, t]
+            terminal_value = fcf_table[j, last] * (1.0 + terminal_growth) / (waccs[i] - terminal_growth)
+            out[i, j] = (pv_fcf_sum + terminal_value * discount_table[i, last] - net_debt) / shares
+    return out
+
+
+def _pv_products(fcf_projections: np.ndarray, discount_factors: np.ndarray) -> np.ndarray:
+    """Elementwise present values of projected cash flows"""
+    if _HAS_NUMEXPR and len(fcf_projections) >= _NUMEXPR_MIN_SIZE:
+        return numexpr.evaluate("fcf_projections * discount_factors")
+    return fcf_projections * discount_factors
+
+
+def _pv_sum(fcf: np.ndarray, discount_factors: np.ndarray) -> np.ndarray:
+    """Sum discounted cash flows along the trailing (year) axis"""
+    fcf, discount_factors = np.broadcast_arrays(fcf, discount_factors)
+    if _HAS_NUMEXPR and fcf.size >= _NUMEXPR_MIN_SIZE:
+        return numexpr.evaluate(f"sum(fcf * discount_factors, axis={fcf.ndim - 1})",
+                                local_dict={'fcf': fcf, 'discount_factors': discount_factors})
+    return (fcf * discount_factors).sum(axis=-1)
+
+
+def _unrolled_kernel_source(projection_years: int) -> str:
+    """Generate a straight-line fair-value kernel for a fixed projection period"""
+    n = projection_years
+    lines = [
+        f"def _kernel_n{n}(current_fcf, growth, wacc, terminal_growth, net_debt, shares):",
+        "    a = 1.0 + growth",
+        "    inv = 1.0 / (1.0 + wacc)",
+        "    f1 = current_fcf * a",
+        "    d1 = inv",
+    ]
+    for t in range(2, n + 1):
+        lines.append(f"    f{t} = f{t-1} * a")
+        lines.append(f"    d{t} = d{t-1} * inv")
+    lines.append("    pv = " + " + ".join(f"f{t} * d{t}" for t in range(1, n + 1)))
+    lines.append(f"    tv = f{n} * (1.0 + terminal_growth) / (wacc - terminal_growth) * d{n}")
+    lines.append("    return (pv + tv - net_debt) / shares")
+    return "\n".join(lines) + "\n"
+
+
+def _build_unrolled_kernels(periods: Tuple[int, ...]) -> Dict[int, Callable[..., float]]:
+    """Compile unrolled kernels for the given projection periods"""
+    kernels = {}
+    for n in periods:
+        namespace = {}
+        exec(_unrolled_kernel_source(n), namespace)
+        kernels[n] = namespace[f"_kernel_n{n}"]
+    return kernels
+
+
+# Specialized kernels for common projection periods (used when Numba is unavailable)
+_UNROLLED_KERNELS = _build_unrolled_kernels((3, 5, 7, 10))
+
+
+def _fair_value(current_fcf: float, growth: float, wacc: float, terminal_growth: float,
+                projection_years: int, net_debt: float, shares: float) -> float:
+    """Fair value per share from scalar inputs using the fastest available kernel"""
+    kernel = None if _HAS_NUMBA else _UNROLLED_KERNELS.get(projection_years)
+    if kernel is None:
+        return _dcf_kernel(float(current_fcf), float(growth), float(wacc),
+                           float(terminal_growth), int(projection_years),
+                           float(net_debt), float(shares))
+    return kernel(current_fcf, growth, wacc, terminal_growth, net_debt, shares)
+
+
+def _assumption_fair_value(company: CompanyData, assumptions: Dict[str, float]) -> float:
+    """Fair value per share from a ValuationAssumptions.to_dict() mapping, without validation"""
+    return _fair_value(company.current_fcf, assumptions['revenue_growth_rate'], assumptions['wacc'],
+                       assumptions['terminal_growth_rate'], assumptions['projection_years'],
+                       company.net_debt, company.shares_outstanding)
+
+
+def _override_assumptions(base: Dict[str, float], **overrides: float) -> Dict[str, float]:
+    """Copy an assumptions mapping with scalar overrides, rejecting unknown names"""
+    unknown = overrides.keys() - base.keys()
+    if unknown:
+        raise TypeError(f"Unknown assumption parameter(s): {', '.join(sorted(unknown))}")
+    return {**base, **overrides}
+
+
+@lru_cache(maxsize=1024)
+def _valuation_core(company_key: Tuple[float, float, float, float],
+                    assumption_key: Tuple[float, float, float, float, int]) -> ValuationResult:
+    """
+    Memoized numeric DCF valuation
+
+    Args:
+        company_key: (stock_price, shares_outstanding, current_fcf, net_debt)
+        assumption_key: (revenue_growth_rate, fcf_margin, terminal_growth_rate,
+            wacc, projection_years)
+
+    Returns:
+        ValuationResult with read-only arrays, shared by every caller that
+        passes the same inputs
+    """
+    current_fcf = company_key[2]
+    growth, _, terminal_growth, wacc, projection_years = assumption_key
+
+    # Project FCF
+    fcf_projections = np.power(1.0 + growth, _years(projection_years))
+    fcf_projections *= current_fcf
+    fcf_projections.setflags(write=False)
+
+    # Calculate discount factors
+    discount_factors = _discount_factors(wacc, projection_years)
+
+    # Calculate PV of FCF
+    pv_fcf = _pv_products(fcf_projections, discount_factors)
+    pv_fcf.setflags(write=False)
+
+    # Calculate terminal value (perpetuity growth)
+    terminal_fcf = float(fcf_projections[-1])
+    terminal_value = terminal_fcf * (1 + terminal_growth) / (wacc - terminal_growth)
+
+    return _valuation_result(company_key, fcf_projections, discount_factors,
+                             pv_fcf, terminal_value)
+
+
+def _valuation_result(company_key: Tuple[float, float, float, float],
+                      fcf_projections: np.ndarray, discount_factors: np.ndarray,
+                      pv_fcf: np.ndarray, terminal_value: float) -> ValuationResult:
+    """Derive enterprise, equity and per share values from the projected cash flows"""
+    stock_price, shares_outstanding, current_fcf, net_debt = company_key
+    pv_terminal_value = terminal_value * float(discount_factors[-1])
+
+    # Calculate enterprise and equity value
+    pv_fcf_sum = float(np.sum(pv_fcf))
+    enterprise_value = pv_fcf_sum + pv_terminal_value
+    equity_value = enterprise_value - net_debt
+
+    # Calculate per share values
+    fair_value_per_share = equity_value / shares_outstanding
+    upside_downside = (fair_value_per_share - stock_price) / stock_price
+
+    # Calculate implied metrics
+    ev_to_fcf = enterprise_value / current_fcf if current_fcf > 0 else None
+    pe_implied = stock_price * shares_outstanding / (current_fcf * 0.8) if current_fcf > 0 else None
+    
+    # Calculate contribution percentages
+    fcf_contribution = pv_fcf_sum / enterprise_value if enterprise_value > 0 else 0
+    terminal_contribution = pv_terminal_value / enterprise_value if enterprise_value > 0 else 0
+
+    return ValuationResult(
+        fcf_projections=fcf_projections,
+        discount_factors=discount_factors,
+        pv_fcf=pv_fcf,
+        terminal_value=terminal_value,
+        pv_terminal_value=pv_terminal_value,
+        pv_fcf_sum=pv_fcf_sum,
+        enterprise_value=enterprise_value,
+        equity_value=equity_value,
+        fair_value_per_share=fair_value_per_share,
+        current_price=stock_price,
+        upside_downside_pct=upside_downside * 100,
+        assessment='UNDERVALUED' if upside_downside > 0 else 'OVERVALUED',
+        ev_to_fcf=ev_to_fcf,
+        implied_pe=pe_implied,
+        fcf_contribution_pct=fcf_contribution * 100,
+        terminal_contribution_pct=terminal_contribution * 100
+    )
+
+
+# DCFValuation methods a subclass can override to change perform_valuation
+_VALUATION_STEPS = ('project_fcf', 'calculate_discount_factors',
+                    'calculate_pv_of_fcf', 'calculate_terminal_value')
 
 
 class DCFValuation:
     """Performs DCF valuation calculations with advanced features"""
 
-    def __init__(self, company: CompanyData, assumptions: ValuationAssumptions):
+    # Set to True to silence assumption warnings for every new instance
+    suppress_warnings = False
+
+    def __init__(self, company: CompanyData, assumptions: ValuationAssumptions,
+                 skip_validation: bool = False):
         self.company = company
         self.assumptions = assumptions
         self.validation_date = datetime.now()
         
+        if skip_validation or self.suppress_warnings:
+            return
+        
         # Validate assumptions
-        is_valid, errors = self.assumptions.validate()
-        if not is_valid:
-            print("⚠️  Warning: Assumption validation issues:")
-            for error in errors:
-                print(f"  - {error}")
-            print()
-
-    def calculate_discount_factors(self) -> List[float]:
+        if not self.assumptions.validate():
+            warnings.warn(
+                "Assumption validation issues:\n  - " +
+                "\n  - ".join(self.assumptions.format_errors()),
+                stacklevel=2
+            )
+
+    def calculate_discount_factors(self) -> np.ndarray:
         """Calculate discount factors for each year"""
-        years = range(1, self.assumptions.projection_years + 1)
-        return [1 / (1 + self.assumptions.wacc) ** year for year in years]
+        return _discount_factors(self.assumptions.wacc, self.assumptions.projection_years)
 
-    def project_fcf(self) -> List[float]:
+    def project_fcf(self) -> np.ndarray:
         """Project free cash flows for explicit forecast period"""
-        fcf_projections = [self.company.current_fcf]
-
-        for year in range(1, self.assumptions.projection_years + 1):
-            next_fcf = fcf_projections[-1] * (1 + self.assumptions.revenue_growth_rate)
-            fcf_projections.append(next_fcf)
-
-        return fcf_projections[1:]  # Exclude base year
+        years = _years(self.assumptions.projection_years)
+        fcf_projections = np.power(1.0 + self.assumptions.revenue_growth_rate, years)
+        fcf_projections *= self.company.current_fcf
+        return fcf_projections
 
     def calculate_terminal_value(self, terminal_fcf: float) -> float:
         """Calculate terminal value using perpetuity growth method"""
         return terminal_fcf * (1 + self.assumptions.terminal_growth_rate) / \
                (self.assumptions.wacc - self.assumptions.terminal_growth_rate)
 
-    def calculate_pv_of_fcf(self, fcf_projections: List[float],
-                           discount_factors: List[float]) -> List[float]:
+    def calculate_pv_of_fcf(self, fcf_projections: np.ndarray,
+                           discount_factors: np.ndarray) -> np.ndarray:
         """Calculate present value of projected free cash flows"""
-        return [fcf * df for fcf, df in zip(fcf_projections, discount_factors)]
+        return _pv_products(np.asarray(fcf_projections, dtype=np.float64),
+                            np.asarray(discount_factors, dtype=np.float64))
 
-    def perform_valuation(self) -> Dict:
+    def perform_valuation(self) -> ValuationResult:
         """Perform complete DCF valuation"""
-        # Project FCF
-        fcf_projections = self.project_fcf()
+        company = self.company
+        assumptions = self.assumptions
+        company_key = (company.stock_price, company.shares_outstanding,
+                       company.current_fcf, company.net_debt)
+
+        # The memoized core only matches the stock step methods
+        if not any(getattr(type(self), name) is not getattr(DCFValuation, name)
+                   for name in _VALUATION_STEPS):
+            return _valuation_core(
+                company_key,
+                (assumptions.revenue_growth_rate, assumptions.fcf_margin,
+                 assumptions.terminal_growth_rate, assumptions.wacc,
+                 assumptions.projection_years)
+            )
 
-        # Calculate discount factors
+        fcf_projections = self.project_fcf()
         discount_factors = self.calculate_discount_factors()
-
-        # Calculate PV of FCF
         pv_fcf = self.calculate_pv_of_fcf(fcf_projections, discount_factors)
+        terminal_value = self.calculate_terminal_value(fcf_projections[-1])
+        return _valuation_result(company_key, fcf_projections, discount_factors,
+                                 pv_fcf, terminal_value)
 
-        # Calculate terminal value
-        terminal_fcf = fcf_projections[-1]
-        terminal_value = self.calculate_terminal_value(terminal_fcf)
-        pv_terminal_value = terminal_value * discount_factors[-1]
-
-        # Calculate enterprise and equity value
-        pv_fcf_sum = sum(pv_fcf)
-        enterprise_value = pv_fcf_sum + pv_terminal_value
-        equity_value = enterprise_value - self.company.net_debt
-
-        # Calculate per share values
-        fair_value_per_share = equity_value / self.company.shares_outstanding
-        upside_downside = (fair_value_per_share - self.company.stock_price) / \
-                         self.company.stock_price
-
-        # Calculate implied metrics
-        ev_to_fcf = enterprise_value / self.company.current_fcf if self.company.current_fcf > 0 else None
-        pe_implied = self.company.market_cap() / (self.company.current_fcf * 0.8) if self.company.current_fcf > 0 else None
-        
-        # Calculate contribution percentages
-        fcf_contribution = pv_fcf_sum / enterprise_value if enterprise_value > 0 else 0
-        terminal_contribution = pv_terminal_value / enterprise_value if enterprise_value > 0 else 0
-
-        return {
-            'fcf_projections': fcf_projections,
-            'discount_factors': discount_factors,
-            'pv_fcf': pv_fcf,
-            'terminal_value': terminal_value,
-            'pv_terminal_value': pv_terminal_value,
-            'pv_fcf_sum': pv_fcf_sum,
-            'enterprise_value': enterprise_value,
-            'equity_value': equity_value,
-            'fair_value_per_share': fair_value_per_share,
-            'current_price': self.company.stock_price,
-            'upside_downside_pct': upside_downside * 100,
-            'assessment': 'UNDERVALUED' if upside_downside > 0 else 'OVERVALUED',
-            'ev_to_fcf': ev_to_fcf,
-            'implied_pe': pe_implied,
-            'fcf_contribution_pct': fcf_contribution * 100,
-            'terminal_contribution_pct': terminal_contribution * 100
-        }
-
-    def create_summary_table(self, results: Dict) -> pd.DataFrame:
+    def create_summary_table(self, results: Mapping) -> pd.DataFrame:
         """Create a formatted summary table of results"""
-        years = list(range(1, self.assumptions.projection_years + 1))
+        years = np.arange(1, self.assumptions.projection_years + 1)
 
         df = pd.DataFrame({
             'Year': years,
-            'FCF ($M)': [f"${x:,.0f}" for x in results['fcf_projections']],
-            'Discount Factor': [f"{x:.4f}" for x in results['discount_factors']],
-            'PV of FCF ($M)': [f"${x:,.0f}" for x in results['pv_fcf']]
+            'FCF ($M)': pd.Series(results['fcf_projections']).map('${:,.0f}'.format),
+            'Discount Factor': pd.Series(results['discount_factors']).map('{:.4f}'.format),
+            'PV of FCF ($M)': pd.Series(results['pv_fcf']).map('${:,.0f}'.format)
         })
 
         return df
 
-    def create_detailed_dataframe(self, results: Dict) -> pd.DataFrame:
+    def create_detailed_dataframe(self, results: Mapping) -> pd.DataFrame:
         """Create detailed DataFrame for export"""
-        years = list(range(1, self.assumptions.projection_years + 1))
+        years = np.arange(1, self.assumptions.projection_years + 1)
         
         df = pd.DataFrame({
             'Year': years,
             'FCF_Projection': results['fcf_projections'],
             'Discount_Factor': results['discount_factors'],
             'PV_FCF': results['pv_fcf'],
-            'Growth_Rate': [self.assumptions.revenue_growth_rate] * len(years)
+            'Growth_Rate': np.full(years.size, self.assumptions.revenue_growth_rate)
         })
         
         return df
 
-    def print_valuation_summary(self, results: Dict):
+    def print_valuation_summary(self, results: Mapping):
         """Print formatted valuation summary"""
-        print(f"\n{'='*80}")
-        print(f"DCF VALUATION ANALYSIS: {self.company.company_name} ({self.company.ticker})")
-        print(f"{'='*80}\n")
-
-        print("📊 COMPANY INFORMATION:")
-        print(f"  Current Stock Price:        ${self.company.stock_price:,.2f}")
-        print(f"  Shares Outstanding:         {self.company.shares_outstanding:,.0f}M")
-        print(f"  Market Cap:                 ${self.company.market_cap():,.0f}M")
-        print(f"  Current FCF:                ${self.company.current_fcf:,.0f}M")
-
-        print("\n📋 KEY ASSUMPTIONS:")
-        print(f"  Revenue Growth Rate:        {self.assumptions.revenue_growth_rate*100:.1f}%")
-        print(f"  Terminal Growth Rate:       {self.assumptions.terminal_growth_rate*100:.1f}%")
-        print(f"  WACC (Discount Rate):       {self.assumptions.wacc*100:.1f}%")
-        print(f"  Projection Period:          {self.assumptions.projection_years} years")
-        print(f"  Net Debt/(Cash):            ${self.company.net_debt:,.0f}M")
-
-        print("\n💰 FREE CASH FLOW PROJECTIONS:")
-        print(self.create_summary_table(results).to_string(index=False))
-
-        print("\n📈 VALUATION BREAKDOWN:")
-        print(f"  PV of Projected FCF:        ${results['pv_fcf_sum']:,.0f}M ({results['fcf_contribution_pct']:.1f}%)")
-        print(f"  Terminal Value:             ${results['terminal_value']:,.0f}M")
-        print(f"  PV of Terminal Value:       ${results['pv_terminal_value']:,.0f}M ({results['terminal_contribution_pct']:.1f}%)")
-        print(f"  Enterprise Value:           ${results['enterprise_value']:,.0f}M")
-        print(f"  Less: Net Debt:             ${self.company.net_debt:,.0f}M")
-        print(f"  Equity Value:               ${results['equity_value']:,.0f}M")
-
-        print(f"\n{'='*80}")
-        print(f"💎 FAIR VALUE PER SHARE:       ${results['fair_value_per_share']:,.2f}")
-        print(f"📍 Current Market Price:       ${results['current_price']:,.2f}")
-        print(f"🎯 Upside/(Downside):          {results['upside_downside_pct']:+.1f}%")
-        print(f"⚖️  Assessment:                 {results['assessment']}")
-        print(f"{'='*80}\n")
+        company = self.company
+        assumptions = self.assumptions
+        divider = '=' * 80
+        lines = []
+
+        lines.append(f"\n{divider}")
+        lines.append(f"DCF VALUATION ANALYSIS: {company.company_name} ({company.ticker})")
+        lines.append(f"{divider}\n")
+
+        lines.append("📊 COMPANY INFORMATION:")
+        lines.append(f"  Current Stock Price:        ${company.stock_price:,.2f}")
+        lines.append(f"  Shares Outstanding:         {company.shares_outstanding:,.0f}M")
+        lines.append(f"  Market Cap:                 ${company.market_cap():,.0f}M")
+        lines.append(f"  Current FCF:                ${company.current_fcf:,.0f}M")
+
+        lines.append("\n📋 KEY ASSUMPTIONS:")
+        lines.append(f"  Revenue Growth Rate:        {assumptions.revenue_growth_rate*100:.1f}%")
+        lines.append(f"  Terminal Growth Rate:       {assumptions.terminal_growth_rate*100:.1f}%")
+        lines.append(f"  WACC (Discount Rate):       {assumptions.wacc*100:.1f}%")
+        lines.append(f"  Projection Period:          {assumptions.projection_years} years")
+        lines.append(f"  Net Debt/(Cash):            ${company.net_debt:,.0f}M")
+
+        lines.append("\n💰 FREE CASH FLOW PROJECTIONS:")
+        lines.append(self.create_summary_table(results).to_string(index=False))
+
+        lines.append("\n📈 VALUATION BREAKDOWN:")
+        lines.append(f"  PV of Projected FCF:        ${results['pv_fcf_sum']:,.0f}M ({results['fcf_contribution_pct']:.1f}%)")
+        lines.append(f"  Terminal Value:             ${results['terminal_value']:,.0f}M")
+        lines.append(f"  PV of Terminal Value:       ${results['pv_terminal_value']:,.0f}M ({results['terminal_contribution_pct']:.1f}%)")
+        lines.append(f"  Enterprise Value:           ${results['enterprise_value']:,.0f}M")
+        lines.append(f"  Less: Net Debt:             ${company.net_debt:,.0f}M")
+        lines.append(f"  Equity Value:               ${results['equity_value']:,.0f}M")
+
+        lines.append(f"\n{divider}")
+        lines.append(f"💎 FAIR VALUE PER SHARE:       ${results['fair_value_per_share']:,.2f}")
+        lines.append(f"📍 Current Market Price:       ${results['current_price']:,.2f}")
+        lines.append(f"🎯 Upside/(Downside):          {results['upside_downside_pct']:+.1f}%")
+        lines.append(f"⚖️  Assessment:                 {results['assessment']}")
+        lines.append(f"{divider}\n")
         
         # Additional metrics
         if results['ev_to_fcf']:
-            print(f"📊 EV/FCF Multiple:            {results['ev_to_fcf']:.2f}x")
+            lines.append(f"📊 EV/FCF Multiple:            {results['ev_to_fcf']:.2f}x")
         
-        print(f"📅 Valuation Date:             {self.validation_date.strftime('%Y-%m-%d %H:%M')}")
-        print()
+        lines.append(f"📅 Valuation Date:             {self.validation_date.strftime('%Y-%m-%d %H:%M')}")
+        lines.append("")
 
+        # Emit the whole report with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def sensitivity_analysis(company: CompanyData, base_assumptions: ValuationAssumptions,
-                        param: str, values: List[float]) -> pd.DataFrame:
+
+# Assumptions that the vectorized sensitivity paths can sweep directly
+_SWEEPABLE_PARAMS = ('wacc', 'revenue_growth_rate', 'terminal_growth_rate')
+
+
+def _float_dtype(precision: Optional[str]) -> np.dtype:
+    """Resolve a sensitivity precision setting to a NumPy float dtype (float64 by default)"""
+    if precision is None:
+        precision = 'float64'
+    if precision not in ('float32', 'float64'):
+        raise ValueError(f"precision must be 'float32' or 'float64', got {precision!r}")
+    return np.dtype(precision)
+
+
+def _valuation_grid(company: CompanyData, assumptions: ValuationAssumptions,
+                    swap: Dict[str, np.ndarray], dtype=np.float64) -> np.ndarray:
     """
-    Perform sensitivity analysis on a parameter
+    Evaluate fair value per share over broadcast assumption overrides
 
     Args:
         company: Company data
-        base_assumptions: Base case assumptions
-        param: Parameter to vary ('wacc', 'revenue_growth_rate', 'terminal_growth_rate')
-        values: List of values to test
-    """
-    results = []
+        assumptions: Base case assumptions
+        swap: Mapping of parameter name (one of _SWEEPABLE_PARAMS, or
+            'current_fcf') to values; the arrays are broadcast against each other
+        dtype: Float dtype for the NumPy broadcast arithmetic; the Numba
+            kernels always compute and return float64
 
-    for value in values:
-        # Create new assumptions with modified parameter
-        assumptions = ValuationAssumptions(
-            revenue_growth_rate=base_assumptions.revenue_growth_rate,
-            fcf_margin=base_assumptions.fcf_margin,
-            terminal_growth_rate=base_assumptions.terminal_growth_rate,
-            wacc=base_assumptions.wacc,
-            projection_years=base_assumptions.projection_years
+    Returns:
+        Fair values per share with the broadcast shape of the swapped arrays
+    """
+    rates = {
+        'current_fcf': company.current_fcf,
+        'revenue_growth_rate': assumptions.revenue_growth_rate,
+        'terminal_growth_rate': assumptions.terminal_growth_rate,
+        'wacc': assumptions.wacc
+    }
+    rates.update(swap)
+    shape = np.broadcast_shapes(*(np.shape(rate) for rate in rates.values()))
+
+    if _HAS_NUMBA:
+        current_fcfs, growths, waccs, terminal_growths = (
+            np.ascontiguousarray(np.broadcast_to(np.asarray(rates[name], dtype=np.float64),
+                                                 shape)).ravel()
+            for name in ('current_fcf', 'revenue_growth_rate', 'wacc', 'terminal_growth_rate')
         )
+        with _PARALLEL_KERNEL_LOCK:
+            fair_values = _dcf_sweep(current_fcfs, growths, waccs, terminal_growths,
+                                     int(assumptions.projection_years), float(company.net_debt),
+                                     float(company.shares_outstanding))
+        return fair_values.reshape(shape)
+
+    rates = {name: np.asarray(rate, dtype=dtype) for name, rate in rates.items()}
+    # Year axis is appended last so every swept axis broadcasts against it
+    years = _years(assumptions.projection_years).astype(dtype, copy=False)
+    current_fcf = rates['current_fcf'][..., None]
+    growth = rates['revenue_growth_rate'][..., None]
+    wacc = rates['wacc'][..., None]
+    terminal_growth = rates['terminal_growth_rate']
+
+    fcf = current_fcf * np.power(1.0 + growth, years)
+    discount_factors = np.power(1.0 + wacc, -years)
+    pv_fcf_sum = _pv_sum(fcf, discount_factors)
+    terminal_value = fcf[..., -1] * (1 + terminal_growth) / (wacc[..., 0] - terminal_growth)
+    equity_value = pv_fcf_sum + terminal_value * discount_factors[..., -1] - company.net_debt
+
+    return np.broadcast_to(equity_value / company.shares_outstanding, shape)
+
+
+def _wacc_growth_grid(company: CompanyData, assumptions: ValuationAssumptions,
+                      wacc_values: np.ndarray, growth_values: np.ndarray,
+                      dtype=np.float64) -> np.ndarray:
+    """
+    Fair values over WACC rows x growth columns, JIT-compiled when Numba is available
 
-        # Modify the specific parameter
-        setattr(assumptions, param, value)
+    dtype only applies to the NumPy fallback; the Numba kernel returns float64.
+    """
+    wacc_values = np.asarray(wacc_values, dtype=np.float64)
+    growth_values = np.asarray(growth_values, dtype=np.float64)
+
+    if _HAS_NUMBA:
+        with _PARALLEL_KERNEL_LOCK:
+            fair_values = _dcf_grid(wacc_values, growth_values, float(company.current_fcf),
+                                    float(assumptions.terminal_growth_rate),
+                                    int(assumptions.projection_years), float(company.net_debt),
+                                    float(company.shares_outstanding))
+        return fair_values
+
+    fair_values = _valuation_grid(
+        company, assumptions,
+        {'wacc': wacc_values[:, None], 'revenue_growth_rate': growth_values[None, :]},
+        dtype
+    )
+    return np.broadcast_to(fair_values, (wacc_values.size, growth_values.size))
+
+
+@lru_cache(maxsize=64)
+def _cached_sensitivity_grid(company_key: Tuple[float, float, float, float],
+                             assumption_key: Tuple[float, float, float, float, int],
+                             wacc_key: Tuple[float, ...],
+                             growth_key: Tuple[float, ...]) -> np.ndarray:
+    """Memoized WACC x growth grid, keyed like _valuation_core plus the two axes"""
+    company = CompanyData('', '', *company_key)
+    assumptions = ValuationAssumptions(*assumption_key)
+
+    fair_values = _wacc_growth_grid(company, assumptions, np.array(wacc_key),
+                                    np.array(growth_key))
+    fair_values.setflags(write=False)
+    return fair_values
+
+
+def _sensitivity_grid(dcf: 'DCFValuation', wacc_values: np.ndarray,
+                      growth_values: np.ndarray) -> np.ndarray:
+    """
+    Fair value per share over a WACC x revenue growth grid
 
-        # Run valuation
-        dcf = DCFValuation(company, assumptions)
-        valuation_results = dcf.perform_valuation()
+    Args:
+        dcf: DCFValuation providing the company and base assumptions
+        wacc_values: WACC values (rows)
+        growth_values: Revenue growth values (columns)
 
-        results.append({
-            param: f"{value*100:.1f}%",
-            'Fair Value': f"${valuation_results['fair_value_per_share']:.2f}",
-            'Upside/(Downside)': f"{valuation_results['upside_downside_pct']:+.1f}%",
-            'Assessment': valuation_results['assessment']
-        })
+    Returns:
+        Read-only array of shape (len(wacc_values), len(growth_values)),
+        shared by every caller that asks for the same grid
+    """
+    company = dcf.company
+    assumptions = dcf.assumptions
+    return _cached_sensitivity_grid(
+        (company.stock_price, company.shares_outstanding,
+         company.current_fcf, company.net_debt),
+        (assumptions.revenue_growth_rate, assumptions.fcf_margin,
+         assumptions.terminal_growth_rate, assumptions.wacc,
+         assumptions.projection_years),
+        tuple(np.asarray(wacc_values, dtype=np.float64).tolist()),
+        tuple(np.asarray(growth_values, dtype=np.float64).tolist())
+    )
 
-    return pd.DataFrame(results)
+
+def sensitivity_analysis(company: CompanyData, base_assumptions: ValuationAssumptions,
+                        param: str, values: List[float],
+                        precision: Optional[str] = None) -> pd.DataFrame:
+    """
+    Perform sensitivity analysis on a parameter
+
+    Args:
+        company: Company data
+        base_assumptions: Base case assumptions
+        param: Parameter to vary ('wacc', 'revenue_growth_rate', 'terminal_growth_rate')
+        values: List of values to test
+        precision: 'float32' or 'float64' arithmetic for the NumPy batched sweep
+            (Numba always uses float64); defaults to float64
+    """
+    if param in _SWEEPABLE_PARAMS:
+        dtype = _float_dtype(precision)
+        fair_values = _valuation_grid(company, base_assumptions,
+                                      {param: np.asarray(values, dtype=np.float64)}, dtype)
+    else:
+        fair_values = np.empty(len(values))
+        base = base_assumptions.to_dict()
+
+        for i, value in enumerate(values):
+            # Override the modified parameter on plain scalars
+            assumptions = _override_assumptions(base, **{param: value})
+            fair_values[i] = _assumption_fair_value(company, assumptions)
+
+    upside_downside = (fair_values - company.stock_price) / company.stock_price
+
+    # Format plain Python floats, then build the frame once
+    return pd.DataFrame({
+        param: [f"{value*100:.1f}%" for value in np.asarray(values, dtype=np.float64).tolist()],
+        'Fair Value': [f"${fair_value:.2f}" for fair_value in fair_values.tolist()],
+        'Upside/(Downside)': [f"{upside*100:+.1f}%" for upside in upside_downside.tolist()],
+        'Assessment': ['UNDERVALUED' if upside > 0 else 'OVERVALUED'
+                       for upside in upside_downside.tolist()]
+    })
 
 
 def two_way_sensitivity(company: CompanyData, base_assumptions: ValuationAssumptions,
                        param1: str, values1: List[float],
-                       param2: str, values2: List[float]) -> pd.DataFrame:
+                       param2: str, values2: List[float],
+                       precision: Optional[str] = None) -> pd.DataFrame:
     """
     Perform two-way sensitivity analysis
     
@@ -281,57 +778,68 @@ def two_way_sensitivity(company: CompanyData, base_assumptions: ValuationAssumpt
         values1: Values for first parameter
         param2: Second parameter to vary
         values2: Values for second parameter
+        precision: 'float32' or 'float64' arithmetic for the NumPy batched grid
+            (Numba always uses float64); defaults to float64
     
     Returns:
         DataFrame with sensitivity matrix
     """
+    if param1 in _SWEEPABLE_PARAMS and param2 in _SWEEPABLE_PARAMS:
+        values1 = np.asarray(values1, dtype=np.float64)
+        values2 = np.asarray(values2, dtype=np.float64)
+        dtype = _float_dtype(precision)
+
+        if (param1, param2) == ('wacc', 'revenue_growth_rate'):
+            fair_values = _wacc_growth_grid(company, base_assumptions, values1, values2, dtype)
+        elif (param1, param2) == ('revenue_growth_rate', 'wacc'):
+            fair_values = _wacc_growth_grid(company, base_assumptions, values2, values1, dtype).T
+        else:
+            fair_values = np.broadcast_to(
+                _valuation_grid(company, base_assumptions,
+                                {param1: values1[:, None], param2: values2[None, :]}, dtype),
+                (values1.size, values2.size)
+            )
+
+        matrix = pd.DataFrame(fair_values, columns=[f"{val2*100:.1f}%" for val2 in values2])
+        matrix = matrix.map(lambda fair_value: f"${fair_value:.2f}")
+        matrix.insert(0, param1, [f"{val1*100:.1f}%" for val1 in values1])
+        return matrix
+
     results = []
+    base = base_assumptions.to_dict()
     
     for val1 in values1:
         row = {f'{param1}': f"{val1*100:.1f}%"}
         
         for val2 in values2:
-            assumptions = ValuationAssumptions(
-                revenue_growth_rate=base_assumptions.revenue_growth_rate,
-                fcf_margin=base_assumptions.fcf_margin,
-                terminal_growth_rate=base_assumptions.terminal_growth_rate,
-                wacc=base_assumptions.wacc,
-                projection_years=base_assumptions.projection_years
-            )
-            
-            setattr(assumptions, param1, val1)
-            setattr(assumptions, param2, val2)
-            
-            dcf = DCFValuation(company, assumptions)
-            valuation_results = dcf.perform_valuation()
+            assumptions = _override_assumptions(base, **{param1: val1, param2: val2})
+            fair_value = _assumption_fair_value(company, assumptions)
             
-            row[f"{val2*100:.1f}%"] = f"${valuation_results['fair_value_per_share']:.2f}"
+            row[f"{val2*100:.1f}%"] = f"${fair_value:.2f}"
         
         results.append(row)
     
     return pd.DataFrame(results)
 
 
-def compare_valuations(valuations: List[Tuple[str, DCFValuation, Dict]]) -> pd.DataFrame:
+def compare_valuations(valuations: List[Tuple[str, DCFValuation, Mapping]]) -> pd.DataFrame:
     """
     Compare multiple valuations side by side
     
     Args:
-        valuations: List of tuples (scenario_name, dcf_object, results_dict)
+        valuations: List of tuples (scenario_name, dcf_object, valuation_result)
     
     Returns:
         Comparison DataFrame
     """
-    comparison_data = []
-    
-    for scenario_name, dcf, results in valuations:
-        comparison_data.append({
-            'Scenario': scenario_name,
-            'Fair Value': f"${results['fair_value_per_share']:.2f}",
-            'Upside/(Downside)': f"{results['upside_downside_pct']:+.1f}%",
-            'Enterprise Value': f"${results['enterprise_value']:,.0f}M",
-            'Terminal Value %': f"{results['terminal_contribution_pct']:.1f}%",
-            'Assessment': results['assessment']
-        })
-    
-    return pd.DataFrame(comparison_data)
+    results = [results for _, _, results in valuations]
+
+    # Format each column with a comprehension, then build the frame once
+    return pd.DataFrame({
+        'Scenario': [scenario_name for scenario_name, _, _ in valuations],
+        'Fair Value': [f"${r['fair_value_per_share']:.2f}" for r in results],
+        'Upside/(Downside)': [f"{r['upside_downside_pct']:+.1f}%" for r in results],
+        'Enterprise Value': [f"${r['enterprise_value']:,.0f}M" for r in results],
+        'Terminal Value %': [f"{r['terminal_contribution_pct']:.1f}%" for r in results],
+        'Assessment': [r['assessment'] for r in results]
+    })
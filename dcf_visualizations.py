@@ -4,14 +4,59 @@ Visualization Module for DCF Analysis
 Create professional charts and visualizations for DCF valuations
 """
 
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import StrMethodFormatter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import os
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Tuple
-from dcf_valuation import DCFValuation, CompanyData, ValuationAssumptions, sensitivity_analysis
+from typing import Dict, Tuple
+from dcf_valuation import DCFValuation, _sensitivity_grid, _valuation_grid
 
 
-def plot_fcf_projections(dcf: DCFValuation, results: Dict, save_path: str = None):
+# Y-axis tick format for values in $ millions; formatters bind to a single
+# axis, so each axis gets its own StrMethodFormatter built from this string
+_MILLIONS_FORMAT = '${x:,.0f}M'
+
+# Largest heatmap grid that gets per-cell value annotations by default
+_MAX_ANNOTATED_CELLS = 64
+
+# File in the output directory recording the inputs hash of the last chart batch
+_CACHE_FILE = '.dcf_cache'
+
+# Rendering settings applied around a chart batch only, leaving the caller's
+# global rcParams untouched
+_CHART_RC = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+}
+
+
+def _new_figure(**kwargs) -> Figure:
+    """Create a Figure on its own Agg canvas, outside pyplot's global figure manager"""
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _prepare_figure(fig, figsize: Tuple[float, float], *grid):
+    """Return (figure, axes) using constrained layout, clearing and resizing fig for reuse when given"""
+    if fig is None:
+        fig = _new_figure(figsize=figsize, layout='constrained')
+        return fig, fig.subplots(*grid)
+    
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.set_layout_engine('constrained')
+    return fig, fig.subplots(*grid)
+
+
+def plot_fcf_projections(dcf: DCFValuation, results: Dict, save_path: str = None, fig=None,
+                         dpi: int = 150):
     """
     Plot FCF projections and present values
     
@@ -19,12 +64,14 @@ def plot_fcf_projections(dcf: DCFValuation, results: Dict, save_path: str = None
         dcf: DCFValuation object
         results: Valuation results
         save_path: Optional path to save figure
+        fig: Optional existing Figure to clear and draw on
+        dpi: Resolution of the saved image (use 300 for print quality)
     """
     years = list(range(1, dcf.assumptions.projection_years + 1))
     fcf = results['fcf_projections']
     pv_fcf = results['pv_fcf']
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    fig, (ax1, ax2) = _prepare_figure(fig, (14, 5), 1, 2)
     
     # FCF Projections
     ax1.bar(years, fcf, color='#366092', alpha=0.8, label='Projected FCF')
@@ -35,11 +82,11 @@ def plot_fcf_projections(dcf: DCFValuation, results: Dict, save_path: str = None
     ax1.legend()
     
     # Format y-axis
-    ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}M'))
+    ax1.yaxis.set_major_formatter(StrMethodFormatter(_MILLIONS_FORMAT))
     
     # PV of FCF
     colors = ['#366092' if i < len(years) else '#FF6B6B' for i in range(len(years) + 1)]
-    all_values = pv_fcf + [results['pv_terminal_value']]
+    all_values = np.append(pv_fcf, results['pv_terminal_value'])
     labels = [f'Year {y}' for y in years] + ['Terminal\nValue']
     
     bars = ax2.bar(range(len(all_values)), all_values, color=colors, alpha=0.8)
@@ -51,25 +98,20 @@ def plot_fcf_projections(dcf: DCFValuation, results: Dict, save_path: str = None
     ax2.grid(axis='y', alpha=0.3)
     
     # Format y-axis
-    ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}M'))
+    ax2.yaxis.set_major_formatter(StrMethodFormatter(_MILLIONS_FORMAT))
     
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'${height:,.0f}M',
-                ha='center', va='bottom', fontsize=8)
-    
-    plt.tight_layout()
+    ax2.bar_label(bars, fmt='${:,.0f}M', fontsize=8)
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
         print(f"✓ Chart saved: {save_path}")
     
     return fig
 
 
-def plot_value_waterfall(dcf: DCFValuation, results: Dict, save_path: str = None):
+def plot_value_waterfall(dcf: DCFValuation, results: Dict, save_path: str = None, fig=None,
+                         dpi: int = 150):
     """
     Create waterfall chart showing enterprise value buildup
     
@@ -77,6 +119,8 @@ def plot_value_waterfall(dcf: DCFValuation, results: Dict, save_path: str = None
         dcf: DCFValuation object
         results: Valuation results
         save_path: Optional path to save figure
+        fig: Optional existing Figure to clear and draw on
+        dpi: Resolution of the saved image (use 300 for print quality)
     """
     categories = ['PV of FCF', 'Terminal Value', 'Enterprise\nValue', 'Less: Net Debt', 'Equity Value']
     values = [
@@ -87,29 +131,18 @@ def plot_value_waterfall(dcf: DCFValuation, results: Dict, save_path: str = None
         results['equity_value']
     ]
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _prepare_figure(fig, (10, 6))
     
-    # Create waterfall effect
-    cumulative = [0]
-    for i, val in enumerate(values[:-1]):
-        cumulative.append(cumulative[-1] + val)
+    # Create waterfall effect: each bar starts where the running total ends,
+    # except the final (equity value) bar which starts at zero
+    bottoms = np.zeros(len(values))
+    bottoms[1:-1] = np.cumsum(values[:-2])
     
     colors = ['#366092', '#4A90E2', '#7CB342', '#FFA726', '#66BB6A']
     
-    # Plot bars
-    for i, (cat, val) in enumerate(zip(categories, values)):
-        if i < len(cumulative) - 1:
-            bottom = cumulative[i]
-            ax.bar(i, val, bottom=bottom, color=colors[i], alpha=0.8, edgecolor='black')
-            
-            # Add value labels
-            ax.text(i, bottom + val/2, f'${val:,.0f}M', 
-                   ha='center', va='center', fontweight='bold', fontsize=9)
-        else:
-            # Final bar (equity value)
-            ax.bar(i, val, color=colors[i], alpha=0.8, edgecolor='black')
-            ax.text(i, val/2, f'${val:,.0f}M', 
-                   ha='center', va='center', fontweight='bold', fontsize=9)
+    # Plot bars and their value labels
+    bars = ax.bar(range(len(values)), values, bottom=bottoms, color=colors, alpha=0.8, edgecolor='black')
+    ax.bar_label(bars, fmt='${:,.0f}M', label_type='center', fontweight='bold', fontsize=9)
     
     ax.set_xticks(range(len(categories)))
     ax.set_xticklabels(categories)
@@ -119,26 +152,17 @@ def plot_value_waterfall(dcf: DCFValuation, results: Dict, save_path: str = None
     ax.grid(axis='y', alpha=0.3)
     
     # Format y-axis
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}M'))
-    
-    plt.tight_layout()
+    ax.yaxis.set_major_formatter(StrMethodFormatter(_MILLIONS_FORMAT))
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
         print(f"✓ Chart saved: {save_path}")
     
     return fig
 
 
-def plot_sensitivity_heatmap(dcf: DCFValuation, save_path: str = None):
-    """
-    Create sensitivity heatmap for WACC vs Growth Rate
-    
-    Args:
-        dcf: DCFValuation object
-        save_path: Optional path to save figure
-    """
-    # Create range of values
+def _heatmap_axes(dcf: DCFValuation) -> Tuple[np.ndarray, np.ndarray]:
+    """WACC (rows) and revenue growth (columns) values around the base case"""
     wacc_values = np.linspace(
         max(dcf.assumptions.wacc - 0.03, dcf.assumptions.terminal_growth_rate + 0.01),
         dcf.assumptions.wacc + 0.03, 7
@@ -147,34 +171,41 @@ def plot_sensitivity_heatmap(dcf: DCFValuation, save_path: str = None):
         max(dcf.assumptions.revenue_growth_rate - 0.10, -0.20),
         dcf.assumptions.revenue_growth_rate + 0.10, 7
     )
+    return wacc_values, growth_values
+
+
+def plot_sensitivity_heatmap(dcf: DCFValuation, save_path: str = None, fig=None,
+                             dpi: int = 150, annotate: bool = None,
+                             fair_values: np.ndarray = None):
+    """
+    Create sensitivity heatmap for WACC vs Growth Rate
+    
+    Args:
+        dcf: DCFValuation object
+        save_path: Optional path to save figure
+        fig: Optional existing Figure to clear and draw on
+        dpi: Resolution of the saved image (use 300 for print quality)
+        annotate: Write each cell's fair value on the heatmap; defaults to
+            True for grids of up to _MAX_ANNOTATED_CELLS cells
+        fair_values: Precomputed grid over _heatmap_axes(dcf); evaluated here when omitted
+    """
+    # Create range of values
+    wacc_values, growth_values = _heatmap_axes(dcf)
     
     # Calculate fair values
-    fair_values = np.zeros((len(wacc_values), len(growth_values)))
-    
-    for i, wacc in enumerate(wacc_values):
-        for j, growth in enumerate(growth_values):
-            temp_assumptions = ValuationAssumptions(
-                revenue_growth_rate=growth,
-                fcf_margin=dcf.assumptions.fcf_margin,
-                terminal_growth_rate=dcf.assumptions.terminal_growth_rate,
-                wacc=wacc,
-                projection_years=dcf.assumptions.projection_years
-            )
-            
-            temp_dcf = DCFValuation(dcf.company, temp_assumptions)
-            temp_results = temp_dcf.perform_valuation()
-            fair_values[i, j] = temp_results['fair_value_per_share']
+    if fair_values is None:
+        fair_values = _sensitivity_grid(dcf, wacc_values, growth_values)
     
     # Create heatmap
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = _prepare_figure(fig, (10, 8))
     
     im = ax.imshow(fair_values, cmap='RdYlGn', aspect='auto')
     
     # Set ticks
     ax.set_xticks(np.arange(len(growth_values)))
     ax.set_yticks(np.arange(len(wacc_values)))
-    ax.set_xticklabels([f'{v*100:.1f}%' for v in growth_values])
-    ax.set_yticklabels([f'{v*100:.1f}%' for v in wacc_values])
+    ax.set_xticklabels(np.char.mod('%.1f%%', growth_values * 100).tolist())
+    ax.set_yticklabels(np.char.mod('%.1f%%', wacc_values * 100).tolist())
     
     # Labels
     ax.set_xlabel('Revenue Growth Rate', fontsize=11)
@@ -182,32 +213,67 @@ def plot_sensitivity_heatmap(dcf: DCFValuation, save_path: str = None):
     ax.set_title(f'Fair Value Sensitivity Analysis - {dcf.company.ticker}\nCurrent Price: ${dcf.company.stock_price:.2f}', 
                 fontsize=12, fontweight='bold')
     
-    # Add text annotations
-    for i in range(len(wacc_values)):
-        for j in range(len(growth_values)):
-            text = ax.text(j, i, f'${fair_values[i, j]:.2f}',
-                         ha="center", va="center", color="black", fontsize=8)
+    # Add text annotations, formatted in one pass
+    if annotate is None:
+        annotate = fair_values.size <= _MAX_ANNOTATED_CELLS
+    
+    if annotate:
+        annotations = np.char.mod('$%.2f', fair_values)
+        for (i, j), text in np.ndenumerate(annotations):
+            ax.text(j, i, text, ha="center", va="center", color="black", fontsize=8)
     
     # Add colorbar
-    cbar = plt.colorbar(im, ax=ax)
+    cbar = fig.colorbar(im, ax=ax)
     cbar.set_label('Fair Value per Share ($)', rotation=270, labelpad=20)
     
     # Highlight base case
     base_wacc_idx = np.argmin(np.abs(wacc_values - dcf.assumptions.wacc))
     base_growth_idx = np.argmin(np.abs(growth_values - dcf.assumptions.revenue_growth_rate))
-    ax.add_patch(plt.Rectangle((base_growth_idx-0.5, base_wacc_idx-0.5), 1, 1,
-                              fill=False, edgecolor='blue', linewidth=3))
-    
-    plt.tight_layout()
+    ax.add_patch(Rectangle((base_growth_idx-0.5, base_wacc_idx-0.5), 1, 1,
+                          fill=False, edgecolor='blue', linewidth=3))
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
         print(f"✓ Chart saved: {save_path}")
     
     return fig
 
 
-def plot_tornado_chart(dcf: DCFValuation, results: Dict, save_path: str = None):
+# Tornado chart parameters: label -> (parameter, [low change, high change])
+_TORNADO_PARAMETERS = {
+    'WACC': ('wacc', [-0.02, +0.02]),
+    'Growth Rate': ('revenue_growth_rate', [-0.05, +0.05]),
+    'Terminal Growth': ('terminal_growth_rate', [-0.01, +0.01]),
+    'Current FCF': ('current_fcf', [-0.20, +0.20])
+}
+
+
+def _tornado_fair_values(dcf: DCFValuation) -> np.ndarray:
+    """Fair values per share for each tornado parameter's (low, high) change"""
+    parameters = _TORNADO_PARAMETERS
+    
+    # One scenario per (parameter, direction): base values everywhere except
+    # the perturbed parameter's own slot
+    scenarios = {
+        'current_fcf': np.full(2 * len(parameters), dcf.company.current_fcf),
+        'revenue_growth_rate': np.full(2 * len(parameters), dcf.assumptions.revenue_growth_rate),
+        'terminal_growth_rate': np.full(2 * len(parameters), dcf.assumptions.terminal_growth_rate),
+        'wacc': np.full(2 * len(parameters), dcf.assumptions.wacc)
+    }
+    
+    for i, (param_key, changes) in enumerate(parameters.values()):
+        for j, change in enumerate(changes):
+            if param_key == 'current_fcf':
+                scenarios[param_key][2 * i + j] *= (1 + change)
+            else:
+                scenarios[param_key][2 * i + j] += change
+    
+    fair_values = _valuation_grid(dcf.company, dcf.assumptions, scenarios)
+    return fair_values.reshape(len(parameters), 2)
+
+
+def plot_tornado_chart(dcf: DCFValuation, results: Dict, save_path: str = None, fig=None,
+                       dpi: int = 150, fair_values: np.ndarray = None):
     """
     Create tornado chart showing impact of parameter changes
     
@@ -215,63 +281,24 @@ def plot_tornado_chart(dcf: DCFValuation, results: Dict, save_path: str = None):
         dcf: DCFValuation object
         results: Base case results
         save_path: Optional path to save figure
+        fig: Optional existing Figure to clear and draw on
+        dpi: Resolution of the saved image (use 300 for print quality)
+        fair_values: Precomputed _tornado_fair_values(dcf); evaluated here when omitted
     """
     base_fair_value = results['fair_value_per_share']
     
-    parameters = {
-        'WACC': ('wacc', [-0.02, +0.02]),
-        'Growth Rate': ('revenue_growth_rate', [-0.05, +0.05]),
-        'Terminal Growth': ('terminal_growth_rate', [-0.01, +0.01]),
-        'Current FCF': ('current_fcf', [-0.20, +0.20])
-    }
+    if fair_values is None:
+        fair_values = _tornado_fair_values(dcf)
     
-    impacts = []
-    
-    for param_name, (param_key, changes) in parameters.items():
-        low_values = []
-        high_values = []
-        
-        for change in changes:
-            temp_company = CompanyData(
-                ticker=dcf.company.ticker,
-                company_name=dcf.company.company_name,
-                stock_price=dcf.company.stock_price,
-                shares_outstanding=dcf.company.shares_outstanding,
-                current_fcf=dcf.company.current_fcf,
-                net_debt=dcf.company.net_debt
-            )
-            
-            temp_assumptions = ValuationAssumptions(
-                revenue_growth_rate=dcf.assumptions.revenue_growth_rate,
-                fcf_margin=dcf.assumptions.fcf_margin,
-                terminal_growth_rate=dcf.assumptions.terminal_growth_rate,
-                wacc=dcf.assumptions.wacc,
-                projection_years=dcf.assumptions.projection_years
-            )
-            
-            if param_key == 'current_fcf':
-                temp_company.current_fcf *= (1 + change)
-            else:
-                current_val = getattr(temp_assumptions, param_key)
-                setattr(temp_assumptions, param_key, current_val + change)
-            
-            temp_dcf = DCFValuation(temp_company, temp_assumptions)
-            temp_results = temp_dcf.perform_valuation()
-            
-            if change < 0:
-                low_values.append(temp_results['fair_value_per_share'])
-            else:
-                high_values.append(temp_results['fair_value_per_share'])
-        
-        low_impact = base_fair_value - low_values[0]
-        high_impact = high_values[0] - base_fair_value
-        impacts.append((param_name, low_impact, high_impact))
+    low_impacts = base_fair_value - fair_values[:, 0]
+    high_impacts = fair_values[:, 1] - base_fair_value
+    impacts = list(zip(_TORNADO_PARAMETERS, low_impacts, high_impacts))
     
     # Sort by total impact
     impacts.sort(key=lambda x: abs(x[1]) + abs(x[2]), reverse=True)
     
     # Create plot
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _prepare_figure(fig, (10, 6))
     
     y_pos = np.arange(len(impacts))
     
@@ -294,16 +321,22 @@ def plot_tornado_chart(dcf: DCFValuation, results: Dict, save_path: str = None):
     ax.legend()
     ax.grid(axis='x', alpha=0.3)
     
-    plt.tight_layout()
-    
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
         print(f"✓ Chart saved: {save_path}")
     
     return fig
 
 
-def create_all_visualizations(dcf: DCFValuation, results: Dict, output_dir: str = "."):
+def _visualization_cache_key(dcf: DCFValuation, results: Dict, dpi: int) -> str:
+    """Short content hash of everything that determines the generated charts"""
+    inputs = (dcf.company, dcf.assumptions, tuple(np.asarray(results['fcf_projections']).tolist()),
+              float(results['enterprise_value']), dpi)
+    return hashlib.blake2b(repr(inputs).encode(), digest_size=8).hexdigest()
+
+
+def create_all_visualizations(dcf: DCFValuation, results: Dict, output_dir: str = ".",
+                              parallel: bool = True, dpi: int = 150, force: bool = False):
     """
     Generate all visualization charts
     
@@ -311,23 +344,68 @@ def create_all_visualizations(dcf: DCFValuation, results: Dict, output_dir: str
         dcf: DCFValuation object
         results: Valuation results
         output_dir: Directory to save charts
+        parallel: Draw the charts concurrently in worker threads, each on its
+            own Figure; when False they are drawn one after another on a
+            single reused figure
+        dpi: Resolution of the saved images (use 300 for print quality)
+        force: Regenerate even if output_dir already holds charts for these inputs
     """
-    import os
+    save_paths = [f"{output_dir}/{name}.png" for name in
+                  ('fcf_projections', 'value_waterfall', 'sensitivity_heatmap', 'tornado_chart')]
+    
+    # Skip the work when the last batch written here came from the same inputs
+    cache_key = _visualization_cache_key(dcf, results, dpi)
+    cache_path = f"{output_dir}/{_CACHE_FILE}"
+    if not force and all(os.path.exists(save_path) for save_path in save_paths):
+        try:
+            with open(cache_path) as f:
+                if f.read().strip() == cache_key:
+                    print("\n✓ Visualizations up to date, skipping regeneration\n")
+                    return
+        except OSError:
+            pass
     
     print("\n📊 Generating visualizations...")
     
-    # FCF Projections
-    plot_fcf_projections(dcf, results, f"{output_dir}/fcf_projections.png")
-    
-    # Waterfall Chart
-    plot_value_waterfall(dcf, results, f"{output_dir}/value_waterfall.png")
+    # Invalidate the recorded key first so a batch that fails part-way can
+    # never be mistaken for an up-to-date one
+    try:
+        os.remove(cache_path)
+    except FileNotFoundError:
+        pass
+    
+    # Evaluate the Numba-backed grids on this thread: the first parallel
+    # kernel launch from a worker thread can hang interpreter exit under the
+    # TBB threading layer, so the workers only draw
+    heatmap_values = _sensitivity_grid(dcf, *_heatmap_axes(dcf))
+    tornado_values = _tornado_fair_values(dcf)
+    
+    fcf_path, waterfall_path, heatmap_path, tornado_path = save_paths
+    charts = [
+        (plot_fcf_projections, (dcf, results), {}, fcf_path),
+        (plot_value_waterfall, (dcf, results), {}, waterfall_path),
+        (plot_sensitivity_heatmap, (dcf,), {'fair_values': heatmap_values}, heatmap_path),
+        (plot_tornado_chart, (dcf, results), {'fair_values': tornado_values}, tornado_path)
+    ]
     
-    # Sensitivity Heatmap
-    plot_sensitivity_heatmap(dcf, f"{output_dir}/sensitivity_heatmap.png")
+    with matplotlib.rc_context(_CHART_RC):
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(charts)) as executor:
+                futures = [executor.submit(plot, *args, save_path, dpi=dpi, **kwargs)
+                           for plot, args, kwargs, save_path in charts]
+                for future in as_completed(futures):
+                    future.result()
+        else:
+            # Reuse one figure (and its canvas) for every chart
+            fig = _new_figure()
+            
+            for plot, args, kwargs, save_path in charts:
+                plot(*args, save_path, fig=fig, dpi=dpi, **kwargs)
     
-    # Tornado Chart
-    plot_tornado_chart(dcf, results, f"{output_dir}/tornado_chart.png")
+    # Record the key only once every chart has been written, atomically
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(cache_key)
+    os.replace(tmp_path, cache_path)
     
     print("✓ All visualizations generated!\n")
-    
-    plt.close('all')
@@ -4,13 +4,18 @@ Excel Export Module for DCF Valuations
 Export DCF analysis to professionally formatted Excel workbooks
 """
 
-import pandas as pd
+import numpy as np
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from typing import Dict
-from dcf_valuation import DCFValuation, CompanyData, ValuationAssumptions
-import os
+from dcf_valuation import DCFValuation, _sensitivity_grid
+
+
+# Sensitivity grid offsets around the base case WACC and revenue growth
+_WACC_OFFSETS = np.array([-0.02, -0.01, 0.0, 0.01, 0.02])
+_GROWTH_OFFSETS = np.array([-0.05, -0.025, 0.0, 0.025, 0.05])
 
 
 class ExcelExporter:
@@ -19,7 +24,7 @@ class ExcelExporter:
     def __init__(self, dcf: DCFValuation, results: Dict):
         self.dcf = dcf
         self.results = results
-        self.wb = Workbook()
+        self.wb = Workbook(write_only=True)
         
         # Define styles
         self.header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
@@ -33,42 +38,58 @@ class ExcelExporter:
             top=Side(style='thin'),
             bottom=Side(style='thin')
         )
+        
+        # Register the cell styles once; cells then take them by name
+        self.wb.add_named_style(NamedStyle(
+            name='header', fill=self.header_fill, font=self.header_font,
+            alignment=Alignment(horizontal='center', vertical='center'), border=self.border
+        ))
+        self.wb.add_named_style(NamedStyle(
+            name='subheader', fill=self.subheader_fill, font=self.subheader_font, border=self.border
+        ))
+        self.wb.add_named_style(NamedStyle(
+            name='highlight', fill=self.highlight_fill, font=Font(bold=True), border=self.border
+        ))
+        self.wb.add_named_style(NamedStyle(
+            name='highlight_price', fill=self.highlight_fill, font=Font(bold=True), border=self.border,
+            number_format='$#,##0.00'
+        ))
+        
+        # Bordered table cells, one combined style per number format
+        for name, number_format in (('table', 'General'), ('table_currency', '$#,##0'),
+                                    ('table_percent', '0.0%'), ('table_factor', '0.0000'),
+                                    ('table_price', '$#,##0.00')):
+            self.wb.add_named_style(NamedStyle(name=name, font=DEFAULT_FONT, border=self.border,
+                                               number_format=number_format))
     
-    def _apply_header_style(self, cell):
-        """Apply header styling to a cell"""
-        cell.fill = self.header_fill
-        cell.font = self.header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = self.border
-    
-    def _apply_subheader_style(self, cell):
-        """Apply subheader styling to a cell"""
-        cell.fill = self.subheader_fill
-        cell.font = self.subheader_font
-        cell.border = self.border
-    
-    def _apply_highlight_style(self, cell):
-        """Apply highlight styling to a cell"""
-        cell.fill = self.highlight_fill
-        cell.border = self.border
-        cell.font = Font(bold=True)
+    def _cell(self, ws, value, style: str = None, number_format: str = None,
+              font: Font = None) -> WriteOnlyCell:
+        """Build a write-only cell carrying its formatting inline"""
+        cell = WriteOnlyCell(ws, value=value)
+        if style:
+            cell.style = style
+        if font:
+            cell.font = font
+        if number_format:
+            cell.number_format = number_format
+        return cell
     
     def create_summary_sheet(self):
         """Create executive summary sheet"""
-        ws = self.wb.active
-        ws.title = "Executive Summary"
+        ws = self.wb.create_sheet("Executive Summary")
         
-        row = 1
+        # Adjust column widths (must precede the first row in write-only mode)
+        ws.column_dimensions['A'].width = 30
+        ws.column_dimensions['B'].width = 20
         
         # Title
-        ws[f'A{row}'] = f"DCF VALUATION: {self.dcf.company.company_name}"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-        row += 2
+        rows = [
+            [self._cell(ws, f"DCF VALUATION: {self.dcf.company.company_name}", font=Font(size=14, bold=True))],
+            []
+        ]
         
         # Company Information
-        ws[f'A{row}'] = "COMPANY INFORMATION"
-        self._apply_subheader_style(ws[f'A{row}'])
-        row += 1
+        rows.append([self._cell(ws, "COMPANY INFORMATION", style='subheader')])
         
         company_data = [
             ["Ticker", self.dcf.company.ticker],
@@ -80,17 +101,11 @@ class ExcelExporter:
             ["Net Debt ($M)", f"${self.dcf.company.net_debt:,.0f}"]
         ]
         
-        for label, value in company_data:
-            ws[f'A{row}'] = label
-            ws[f'B{row}'] = value
-            row += 1
-        
-        row += 1
+        rows.extend(company_data)
+        rows.append([])
         
         # Assumptions
-        ws[f'A{row}'] = "VALUATION ASSUMPTIONS"
-        self._apply_subheader_style(ws[f'A{row}'])
-        row += 1
+        rows.append([self._cell(ws, "VALUATION ASSUMPTIONS", style='subheader')])
         
         assumptions_data = [
             ["Revenue Growth Rate", f"{self.dcf.assumptions.revenue_growth_rate*100:.1f}%"],
@@ -99,17 +114,11 @@ class ExcelExporter:
             ["Projection Period", f"{self.dcf.assumptions.projection_years} years"]
         ]
         
-        for label, value in assumptions_data:
-            ws[f'A{row}'] = label
-            ws[f'B{row}'] = value
-            row += 1
-        
-        row += 1
+        rows.extend(assumptions_data)
+        rows.append([])
         
         # Valuation Results
-        ws[f'A{row}'] = "VALUATION RESULTS"
-        self._apply_subheader_style(ws[f'A{row}'])
-        row += 1
+        rows.append([self._cell(ws, "VALUATION RESULTS", style='subheader')])
         
         results_data = [
             ["Enterprise Value ($M)", f"${self.results['enterprise_value']:,.0f}"],
@@ -123,140 +132,83 @@ class ExcelExporter:
         ]
         
         for label, value in results_data:
-            ws[f'A{row}'] = label
-            ws[f'B{row}'] = value
             if label in ["Fair Value Per Share", "Assessment"]:
-                self._apply_highlight_style(ws[f'A{row}'])
-                self._apply_highlight_style(ws[f'B{row}'])
-            row += 1
+                rows.append([self._cell(ws, label, style='highlight'),
+                             self._cell(ws, value, style='highlight')])
+            else:
+                rows.append([label, value])
         
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 20
+        for row in rows:
+            ws.append(row)
     
     def create_fcf_projections_sheet(self):
         """Create FCF projections sheet"""
         ws = self.wb.create_sheet("FCF Projections")
         
-        # Create DataFrame
-        years = list(range(1, self.dcf.assumptions.projection_years + 1))
-        df = pd.DataFrame({
-            'Year': years,
-            'FCF ($M)': self.results['fcf_projections'],
-            'Growth Rate': [self.dcf.assumptions.revenue_growth_rate] * len(years),
-            'Discount Factor': self.results['discount_factors'],
-            'PV of FCF ($M)': self.results['pv_fcf']
-        })
-        
-        # Write header
-        ws['A1'] = "FREE CASH FLOW PROJECTIONS"
-        ws['A1'].font = Font(size=12, bold=True)
-        
-        # Write DataFrame
-        for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), start=3):
-            for c_idx, value in enumerate(row, start=1):
-                cell = ws.cell(row=r_idx, column=c_idx, value=value)
-                
-                if r_idx == 3:  # Header row
-                    self._apply_header_style(cell)
-                else:
-                    cell.border = self.border
-                    
-                    # Format numbers
-                    if c_idx in [2, 5]:  # FCF and PV columns
-                        cell.number_format = '$#,##0'
-                    elif c_idx in [3, 4]:  # Growth and discount factor
-                        cell.number_format = '0.0%' if c_idx == 3 else '0.0000'
-        
-        # Add terminal value row
-        last_row = 3 + len(df) + 2
-        ws[f'A{last_row}'] = "Terminal Value"
-        ws[f'B{last_row}'] = self.results['terminal_value']
-        ws[f'B{last_row}'].number_format = '$#,##0'
-        self._apply_highlight_style(ws[f'A{last_row}'])
-        
-        ws[f'A{last_row+1}'] = "PV of Terminal Value"
-        ws[f'B{last_row+1}'] = self.results['pv_terminal_value']
-        ws[f'B{last_row+1}'].number_format = '$#,##0'
-        self._apply_highlight_style(ws[f'A{last_row+1}'])
-        
         # Adjust column widths
         for col in range(1, 6):
             ws.column_dimensions[chr(64 + col)].width = 18
+        
+        # Write header
+        rows = [[self._cell(ws, "FREE CASH FLOW PROJECTIONS", font=Font(size=12, bold=True))], []]
+        
+        header = ('Year', 'FCF ($M)', 'Growth Rate', 'Discount Factor', 'PV of FCF ($M)')
+        rows.append([self._cell(ws, value, style='header') for value in header])
+        
+        # One row per projection year, straight from the result arrays
+        styles = ('table', 'table_currency', 'table_percent', 'table_factor', 'table_currency')
+        growth = self.dcf.assumptions.revenue_growth_rate
+        projections = np.column_stack((self.results['fcf_projections'],
+                                       self.results['discount_factors'],
+                                       self.results['pv_fcf'])).tolist()
+        for year, (fcf, discount_factor, pv) in enumerate(projections, start=1):
+            rows.append([self._cell(ws, value, style=style)
+                         for value, style in zip((year, fcf, growth, discount_factor, pv), styles)])
+        
+        # Add terminal value rows
+        rows.append([])
+        rows.append([self._cell(ws, "Terminal Value", style='highlight'),
+                     self._cell(ws, self.results['terminal_value'], number_format='$#,##0')])
+        rows.append([self._cell(ws, "PV of Terminal Value", style='highlight'),
+                     self._cell(ws, self.results['pv_terminal_value'], number_format='$#,##0')])
+        
+        for row in rows:
+            ws.append(row)
     
     def create_sensitivity_sheet(self):
         """Create sensitivity analysis sheet"""
         ws = self.wb.create_sheet("Sensitivity Analysis")
         
-        ws['A1'] = "SENSITIVITY ANALYSIS: WACC vs Growth Rate"
-        ws['A1'].font = Font(size=12, bold=True)
+        # Adjust column widths
+        ws.column_dimensions['A'].width = 15
+        for col in range(2, 7):
+            ws.column_dimensions[chr(64 + col)].width = 12
         
-        # WACC sensitivity
-        wacc_values = [self.dcf.assumptions.wacc - 0.02, 
-                      self.dcf.assumptions.wacc - 0.01,
-                      self.dcf.assumptions.wacc,
-                      self.dcf.assumptions.wacc + 0.01,
-                      self.dcf.assumptions.wacc + 0.02]
+        rows = [[self._cell(ws, "SENSITIVITY ANALYSIS: WACC vs Growth Rate", font=Font(size=12, bold=True))], []]
         
-        growth_values = [self.dcf.assumptions.revenue_growth_rate - 0.05,
-                        self.dcf.assumptions.revenue_growth_rate - 0.025,
-                        self.dcf.assumptions.revenue_growth_rate,
-                        self.dcf.assumptions.revenue_growth_rate + 0.025,
-                        self.dcf.assumptions.revenue_growth_rate + 0.05]
+        # WACC and growth sensitivity axes
+        wacc_values = self.dcf.assumptions.wacc + _WACC_OFFSETS
+        growth_values = self.dcf.assumptions.revenue_growth_rate + _GROWTH_OFFSETS
         
-        # Create sensitivity table
-        row = 3
-        col = 2
+        # Calculate fair values for the whole grid at once, and flag the base case
+        fair_values = _sensitivity_grid(self.dcf, wacc_values, growth_values)
+        base_case = np.outer(np.abs(wacc_values - self.dcf.assumptions.wacc) < 0.001,
+                             np.abs(growth_values - self.dcf.assumptions.revenue_growth_rate) < 0.001)
         
         # Header row (growth rates)
-        ws.cell(row=row, column=1, value="WACC \\ Growth")
-        self._apply_header_style(ws.cell(row=row, column=1))
-        
-        for growth in growth_values:
-            ws.cell(row=row, column=col, value=f"{growth*100:.1f}%")
-            self._apply_header_style(ws.cell(row=row, column=col))
-            col += 1
+        rows.append([self._cell(ws, "WACC \\ Growth", style='header')] +
+                    [self._cell(ws, f"{growth*100:.1f}%", style='header') for growth in growth_values])
         
         # Data rows
-        row += 1
-        for wacc in wacc_values:
-            ws.cell(row=row, column=1, value=f"{wacc*100:.1f}%")
-            self._apply_subheader_style(ws.cell(row=row, column=1))
-            
-            col = 2
-            for growth in growth_values:
-                # Calculate fair value with these parameters
-                from dcf_valuation import ValuationAssumptions, DCFValuation
-                
-                temp_assumptions = ValuationAssumptions(
-                    revenue_growth_rate=growth,
-                    fcf_margin=self.dcf.assumptions.fcf_margin,
-                    terminal_growth_rate=self.dcf.assumptions.terminal_growth_rate,
-                    wacc=wacc,
-                    projection_years=self.dcf.assumptions.projection_years
-                )
-                
-                temp_dcf = DCFValuation(self.dcf.company, temp_assumptions)
-                temp_results = temp_dcf.perform_valuation()
-                
-                cell = ws.cell(row=row, column=col, 
-                             value=temp_results['fair_value_per_share'])
-                cell.number_format = '$#,##0.00'
-                cell.border = self.border
-                
+        for wacc, values, is_base_row in zip(wacc_values, fair_values.tolist(), base_case.tolist()):
+            row = [self._cell(ws, f"{wacc*100:.1f}%", style='subheader')]
+            for value, is_base in zip(values, is_base_row):
                 # Highlight base case
-                if abs(wacc - self.dcf.assumptions.wacc) < 0.001 and \
-                   abs(growth - self.dcf.assumptions.revenue_growth_rate) < 0.001:
-                    self._apply_highlight_style(cell)
-                
-                col += 1
-            
-            row += 1
+                row.append(self._cell(ws, value, style='highlight_price' if is_base else 'table_price'))
+            rows.append(row)
         
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 15
-        for col in range(2, 7):
-            ws.column_dimensions[chr(64 + col)].width = 12
+        for row in rows:
+            ws.append(row)
     
     def export(self, filename: str):
         """